@@ -176,6 +176,10 @@ void draw_buffer_spi(int x1, int y1, int x2, int y2, unsigned char *p) {
 
     define_region_spi(x1, y1, x2, y2, 1);
 
+#ifdef ILI9488
+    // stage converted pixels in lcd_buffer so the FIFO is fed in bulk
+    unsigned char *out = lcd_buffer;
+#endif
     for (i = 0; i < pixelCount; i++) {
         uint16_t pixel = pixelBuffer[i];
 
@@ -191,17 +195,24 @@ void draw_buffer_spi(int x1, int y1, int x2, int y2, unsigned char *p) {
 
 #ifdef ILI9488
         // Convert each RGB565 pixel to RGB888 (3 bytes per pixel) for ILI9488
-        uint8_t rgb[3];
-        rgb[0] = r8;  // Red
-        rgb[1] = g8;  // Green
-        rgb[2] = b8;  // Blue
-        hw_send_spi(rgb, 3);
+        out[0] = r8;  // Red
+        out[1] = g8;  // Green
+        out[2] = b8;  // Blue
+        out += 3;
+        if (out == lcd_buffer + sizeof(lcd_buffer)) {
+            spi_write_fast(Pico_LCD_SPI_MOD, lcd_buffer, sizeof(lcd_buffer));
+            out = lcd_buffer;
+        }
 #else
         // For other controllers or if using 16-bit mode, retain the original conversion
         hw_send_spi(q, 2);
 #endif
     }
 
+#ifdef ILI9488
+    spi_write_fast(Pico_LCD_SPI_MOD, lcd_buffer, out - lcd_buffer);
+    spi_finish(Pico_LCD_SPI_MOD);
+#endif
     lcd_spi_raise_cs();
 }
 
@@ -216,6 +227,7 @@ void draw_bitmap_spi(int x1, int y1, int width, int height, int scale, int fc, i
     char f[3], b[3];
     int vertCoord, horizCoord, XStart, XEnd, YEnd;
     char *p = 0;
+    unsigned char *q;
     union colourmap {
         char rgbbytes[4];
         unsigned int rgb;
@@ -249,16 +261,20 @@ void draw_bitmap_spi(int x1, int y1, int width, int height, int scale, int fc, i
         for (j = 0; j < scale; j++) {                                // repeat lines to scale the font
             if (vertCoord++ < 0) continue;                           // we are above the top of the screen
             if (vertCoord > vres) {                                  // we have extended beyond the bottom of the screen
+                spi_finish(Pico_LCD_SPI_MOD);
                 lcd_spi_raise_cs();                                  //set CS high
                 return;
             }
             horizCoord = x1;
+            q = lcd_buffer;                                          // a scan line is at most hres pixels, so it fits
             for (k = 0; k < width; k++) {                            // step through each bit in a scan line
                 for (m = 0; m < scale; m++) {                        // repeat pixels to scale in the x axis
                     if (horizCoord++ < 0) continue;                  // we have not reached the left margin
                     if (horizCoord > hres) continue;                 // we are beyond the right margin
                     if ((bitmap[((i * width) + k) / 8] >> (((height * width) - ((i * width) + k) - 1) % 8)) & 1) {
-                        hw_send_spi((uint8_t *) &f, 3);
+                        q[0] = f[0];
+                        q[1] = f[1];
+                        q[2] = f[2];
                     } else {
                         if (bc == -1) {
                             c.rgbbytes[0] = p[n];
@@ -270,13 +286,18 @@ void draw_bitmap_spi(int x1, int y1, int width, int height, int scale, int fc, i
                             b[2] = c.rgbbytes[0];
 #endif
                         }
-                        hw_send_spi((uint8_t *) &b, 3);
+                        q[0] = b[0];
+                        q[1] = b[1];
+                        q[2] = b[2];
                     }
+                    q += 3;
                     n += 3;
                 }
             }
+            spi_write_fast(Pico_LCD_SPI_MOD, lcd_buffer, q - lcd_buffer); // send the whole scan line at once
         }
     }
+    spi_finish(Pico_LCD_SPI_MOD);
     lcd_spi_raise_cs();                                  //set CS high
 
 }
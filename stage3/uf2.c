@@ -74,7 +74,7 @@ bool load_application_from_uf2(const char* filename)
         continue;
       }
 
-      memcpy((void*)b->target_addr, b->data, b->payload_size);
+      memcpy((void*)b->target_addr, b->data, UF2_BLOCK_SIZE);
 
       s.num_blks_written++;
     }
@@ -85,7 +85,7 @@ bool load_application_from_uf2(const char* filename)
         continue;
       }
 
-      memcpy((void*)b->target_addr, b->data, b->payload_size);
+      memcpy((void*)b->target_addr, b->data, UF2_BLOCK_SIZE);
 
       s.prog_addr = b->target_addr;
       s.num_blks  = b->num_blocks;
@@ -132,6 +132,13 @@ static bool check_generic_block(const struct uf2_block* b)
     DEBUG_PRINT("Invalid UF2 magic\n");
     return false;
   }
+  // the SRAM range and address stride checks assume every block carries exactly
+  // one 256 byte page, which is all the pico-sdk ever emits
+  if (b->payload_size != UF2_BLOCK_SIZE)
+  {
+    DEBUG_PRINT("Incorrect block size\n");
+    return false;
+  }
   if (b->num_blocks == 0)
   {
     DEBUG_PRINT("Nothing to write\n");
@@ -269,6 +269,12 @@ enum uf2_result_e __attribute__((optimize("-O0"))) load_application_from_uf2(con
 
       s.num_blks_written++;
     }
+
+    if (s.num_blks == s.num_blks_written)
+    {
+      // Everything is flashed; any remaining blocks belong to other families
+      break;
+    }
   }
 
   f_close(&fp);